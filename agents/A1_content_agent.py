@@ -48,7 +48,7 @@ class ContentAgent(BaseAgent):
         Your writing should be clear, concise, and informative. Always aim for 300-350 words."""
         
         self.logger.info(f"Generating article about: {topic}")
-        article = self.generate_with_llm(prompt, system_prompt)
+        article = await self.generate_with_llm(prompt, system_prompt)
         
         if not article:
             self.logger.error("Failed to generate article")
@@ -61,7 +61,7 @@ class ContentAgent(BaseAgent):
         if word_count < 300:
             # Add more content
             additional_prompt = f"The following article is only {word_count} words. Please expand it to 320-350 words while maintaining quality:\n\n{article}"
-            article = self.generate_with_llm(additional_prompt, system_prompt)
+            article = await self.generate_with_llm(additional_prompt, system_prompt)
         elif word_count > 350:
             # Truncate intelligently (keep sentences)
             sentences = article.split('. ')
@@ -77,14 +77,14 @@ class ContentAgent(BaseAgent):
             article = '. '.join(truncated) + '.'
         
         # Create filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = f"{datetime.now():%Y%m%d_%H%M%S}"
         safe_topic = "".join(c for c in topic.lower() if c.isalnum() or c == ' ').replace(' ', '_')[:50]
         filename = f"articles/{safe_topic}_{timestamp}.md"
         
         # Format the article with metadata
         formatted_article = f"""# {topic}
 
-*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*Generated on {datetime.now():%Y-%m-%d %H:%M:%S}*
 *Word count: {len(article.split())}*
 
 ---
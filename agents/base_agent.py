@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, List, Optional
 from llm.manager import LLMManager
 
 from utils.logger import setup_logger
@@ -36,9 +36,10 @@ class BaseAgent(ABC):
         """Execute agent's main task"""
         pass
     
-    def generate_with_llm(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    async def generate_with_llm(self, prompt: str, system_prompt: Optional[str] = None,
+                                max_tokens: int = 1000, stop: Optional[List[str]] = None) -> str:
         """Generate text using LLM with fallback"""
-        return self.llm_manager.generate(prompt, system_prompt)
+        return await self.llm_manager.generate(prompt, system_prompt, max_tokens, stop)
     
     def health_check(self) -> dict:
         """Check agent health"""
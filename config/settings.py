@@ -26,6 +26,9 @@ MIN_COMMITS_PER_DAY = int(os.getenv("MIN_COMMITS_PER_DAY", "20"))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 MAX_TOKENS = int(os.getenv("MAX_TOKENS", "7000"))
 TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
+LLM_HEDGE_DELAY = float(os.getenv("LLM_HEDGE_DELAY", "2.0"))
+LLM_HEDGE_TOKENS = int(os.getenv("LLM_HEDGE_TOKENS", "64"))
+HEALTH_TTL = float(os.getenv("HEALTH_TTL", "300"))
 
 # Scheduler Configuration
 COMMIT_WINDOW_HOURS = 8
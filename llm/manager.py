@@ -1,9 +1,17 @@
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List, Tuple
 import google.generativeai as genai
-import requests
+import httpx
 import json
 
+from config.settings import (
+    NIM_API_KEY, NIM_MODEL,
+    GOOGLE_API_KEY, GOOGLE_MODEL,
+    OPENROUTER_API_KEY, OPENROUTER_MODEL,
+    LLM_HEDGE_DELAY, LLM_HEDGE_TOKENS, HEALTH_TTL
+)
 from utils.logger import setup_logger
 logger = setup_logger(__name__)
 
@@ -13,12 +21,31 @@ class LLMManager:
     def __init__(self):
         self.providers = ["nvidia", "google", "openrouter"]
         self.current_provider_idx = 0
+        self._client: Optional[httpx.AsyncClient] = None
+        self._google_model: Optional[genai.GenerativeModel] = None
+        # provider -> (time.monotonic() of the probe, status)
+        self._health_cache: Dict[str, Tuple[float, bool]] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared, connection-pooled HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=16)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
-    def _try_nvidia(self, prompt: str, system_prompt: Optional[str] = None) -> Optional[str]:
+    async def _try_nvidia(self, prompt: str, system_prompt: Optional[str] = None,
+                          max_tokens: int = 1000, stop: Optional[List[str]] = None) -> Optional[str]:
         """Try NVIDIA NIM API"""
         try:
-            from config.settings import NIM_API_KEY, NIM_MODEL
-            
             if not NIM_API_KEY:
                 raise ValueError("NVIDIA API key not configured")
             
@@ -36,14 +63,15 @@ class LLMManager:
                 "model": NIM_MODEL,
                 "messages": messages,
                 "temperature": 0.7,
-                "max_tokens": 1000
+                "max_tokens": max_tokens
             }
+            if stop:
+                payload["stop"] = stop
             
-            response = requests.post(
+            response = await self._get_client().post(
                 "https://integrate.api.nvidia.com/v1/chat/completions",
                 headers=headers,
-                json=payload,
-                timeout=30
+                json=payload
             )
             
             if response.status_code == 200:
@@ -57,33 +85,38 @@ class LLMManager:
             logger.error(f"NVIDIA API failed: {e}")
             return None
     
-    def _try_google(self, prompt: str, system_prompt: Optional[str] = None) -> Optional[str]:
+    async def _try_google(self, prompt: str, system_prompt: Optional[str] = None,
+                          max_tokens: int = 1000, stop: Optional[List[str]] = None) -> Optional[str]:
         """Try Google Gemini API"""
         try:
-            from config.settings import GOOGLE_API_KEY, GOOGLE_MODEL
-            
             if not GOOGLE_API_KEY:
                 raise ValueError("Google API key not configured")
             
-            genai.configure(api_key=GOOGLE_API_KEY)
-            model = genai.GenerativeModel(GOOGLE_MODEL)
+            # Configure and build the model once, then reuse it
+            if self._google_model is None:
+                genai.configure(api_key=GOOGLE_API_KEY)
+                self._google_model = genai.GenerativeModel(GOOGLE_MODEL)
+            model = self._google_model
             
             full_prompt = prompt
             if system_prompt:
                 full_prompt = f"{system_prompt}\n\n{prompt}"
             
-            response = model.generate_content(full_prompt)
+            generation_config = genai.GenerationConfig(
+                max_output_tokens=max_tokens,
+                stop_sequences=stop
+            )
+            response = await model.generate_content_async(full_prompt, generation_config=generation_config)
             return response.text
             
         except Exception as e:
             logger.error(f"Google Gemini failed: {e}")
             return None
     
-    def _try_openrouter(self, prompt: str, system_prompt: Optional[str] = None) -> Optional[str]:
+    async def _try_openrouter(self, prompt: str, system_prompt: Optional[str] = None,
+                              max_tokens: int = 1000, stop: Optional[List[str]] = None) -> Optional[str]:
         """Try OpenRouter API"""
         try:
-            from config.settings import OPENROUTER_API_KEY, OPENROUTER_MODEL
-            
             if not OPENROUTER_API_KEY:
                 raise ValueError("OpenRouter API key not configured")
             
@@ -103,14 +136,15 @@ class LLMManager:
                 "model": OPENROUTER_MODEL,
                 "messages": messages,
                 "temperature": 0.7,
-                "max_tokens": 1000
+                "max_tokens": max_tokens
             }
+            if stop:
+                data["stop"] = stop
             
-            response = requests.post(
+            response = await self._get_client().post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers=headers,
-                json=data,
-                timeout=30
+                json=data
             )
             
             if response.status_code == 200:
@@ -124,56 +158,87 @@ class LLMManager:
             logger.error(f"OpenRouter failed: {e}")
             return None
     
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    async def _call_provider(self, provider: str, prompt: str, system_prompt: Optional[str] = None,
+                             max_tokens: int = 1000, stop: Optional[List[str]] = None) -> Optional[str]:
+        """Dispatch a request to a single provider"""
+        if provider == "nvidia":
+            return await self._try_nvidia(prompt, system_prompt, max_tokens, stop)
+        elif provider == "google":
+            return await self._try_google(prompt, system_prompt, max_tokens, stop)
+        elif provider == "openrouter":
+            return await self._try_openrouter(prompt, system_prompt, max_tokens, stop)
+        return None
+    
+    async def generate(self, prompt: str, system_prompt: Optional[str] = None,
+                       max_tokens: int = 1000, stop: Optional[List[str]] = None) -> str:
         """
         Generate text with fallback mechanism
+        Providers are hedged: if one has not answered within the hedge delay
+        (or fails), the next is started and the first valid response wins.
+        The delay is LLM_HEDGE_DELAY for requests up to LLM_HEDGE_TOKENS and
+        grows with max_tokens, so long generations only fall back on failure.
         Returns: Generated text or empty string if all providers fail
         """
-        # Start with configured provider
-        start_idx = 0
-        providers = ["nvidia", "google", "openrouter"]
+        hedge_delay = LLM_HEDGE_DELAY * max(1.0, max_tokens / LLM_HEDGE_TOKENS)
+        queue = list(self.providers)
+        names: Dict[asyncio.Task, str] = {}
+        pending = set()
         
-        for i in range(len(providers)):
-            provider_idx = (start_idx + i) % len(providers)
-            provider = providers[provider_idx]
-            
-            logger.info(f"Trying {provider} provider...")
-            
-            result = None
-            if provider == "nvidia":
-                result = self._try_nvidia(prompt, system_prompt)
-            elif provider == "google":
-                result = self._try_google(prompt, system_prompt)
-            elif provider == "openrouter":
-                result = self._try_openrouter(prompt, system_prompt)
-            
-            if result:
-                logger.info(f"Successfully generated text using {provider}")
-                return result
+        try:
+            while queue or pending:
+                if queue:
+                    provider = queue.pop(0)
+                    logger.info(f"Trying {provider} provider...")
+                    task = asyncio.create_task(self._call_provider(provider, prompt, system_prompt, max_tokens, stop))
+                    names[task] = provider
+                    pending.add(task)
+                
+                # Give in-flight providers a head start before hedging with the next one
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=hedge_delay if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for task in done:
+                    result = task.result()
+                    if result:
+                        logger.info(f"Successfully generated text using {names[task]}")
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
         
         logger.error("All LLM providers failed")
         return ""
     
-    def test_connection(self) -> Dict[str, bool]:
-        """Test connection to all providers"""
+    async def _test_provider(self, provider: str, test_prompt: str) -> bool:
+        """Probe a single provider"""
+        try:
+            # A single token is enough to prove the provider answers
+            result = await self._call_provider(provider, test_prompt, max_tokens=1)
+            ok = bool(result)
+            # Use ASCII characters instead of Unicode for Windows compatibility
+            status = "OK" if ok else "FAIL"
+            logger.info(f"{provider}: {status}")
+            return ok
+        except Exception as e:
+            logger.error(f"{provider} test failed: {e}")
+            return False
+    
+    async def test_connection(self) -> Dict[str, bool]:
+        """Test connection to all providers, reusing results younger than HEALTH_TTL"""
         test_prompt = "Hello, are you working?"
         
-        results = {}
-        for provider in self.providers:
-            try:
-                if provider == "nvidia":
-                    result = self._try_nvidia(test_prompt)
-                elif provider == "google":
-                    result = self._try_google(test_prompt)
-                elif provider == "openrouter":
-                    result = self._try_openrouter(test_prompt)
-                
-                results[provider] = bool(result)
-                # Use ASCII characters instead of Unicode for Windows compatibility
-                status = "OK" if results[provider] else "FAIL"
-                logger.info(f"{provider}: {status}")
-            except Exception as e:
-                results[provider] = False
-                logger.error(f"{provider} test failed: {e}")
+        now = time.monotonic()
+        stale = [p for p in self.providers
+                 if p not in self._health_cache or now - self._health_cache[p][0] >= HEALTH_TTL]
+        
+        # Probe stale providers concurrently
+        statuses = await asyncio.gather(
+            *(self._test_provider(provider, test_prompt) for provider in stale)
+        )
+        for provider, status in zip(stale, statuses):
+            self._health_cache[provider] = (now, status)
         
-        return results
\ No newline at end of file
+        return {p: self._health_cache[p][1] for p in self.providers}
\ No newline at end of file
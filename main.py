@@ -1,50 +1,65 @@
 #!/usr/bin/env python3
 import asyncio
-import logging
 import sys
 from datetime import datetime
 from pathlib import Path
 import signal
+from typing import TYPE_CHECKING, Optional
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from config.settings import LOG_LEVEL, GITHUB_TOKEN, GITHUB_USERNAME
-from llm.manager import LLMManager
-from agents.github_agent import GitHubAgent
-from agents.A1_content_agent import ContentAgent
-from utils.scheduler_manager import SchedulerManager
+from config.settings import GITHUB_TOKEN, GITHUB_USERNAME
+from utils.logger import setup_logger, start_log_listener, stop_log_listener
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('github_agent.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger(__name__)
+# The LLM SDKs, git and numpy are imported lazily so a missing
+# configuration exits before paying for them
+if TYPE_CHECKING:
+    from agents.github_agent import GitHubAgent
+    from agents.A1_content_agent import ContentAgent
+
+logger = setup_logger(__name__)
 
 class GitHubAIAgentApp:
     """Main application orchestrating AI agents"""
     
     def __init__(self, repo_url: str):
+        from llm.manager import LLMManager
+        from utils.scheduler_manager import SchedulerManager
+        
         self.repo_url = repo_url
         self.llm_manager = LLMManager()
-        self.github_agent: GitHubAgent = None
-        self.A1_content_agent: ContentAgent = None
+        self.github_agent: "GitHubAgent" = None
+        self.A1_content_agent: "ContentAgent" = None
         self.scheduler = SchedulerManager()
-        self.running = False
-        
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
+        self._run_task: Optional[asyncio.Task] = None
+        # Set on shutdown to wake any pending waits immediately
+        self._stop_event = asyncio.Event()
     
-    def signal_handler(self, sig, frame):
-        """Handle interrupt signals"""
+    def _install_signal_handlers(self):
+        """Route SIGINT/SIGTERM to _on_stop on the running event loop"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            if sys.platform == "win32":
+                # The Windows event loops do not support add_signal_handler
+                signal.signal(sig, self.signal_handler)
+            else:
+                loop.add_signal_handler(sig, self._on_stop, sig)
+    
+    def _on_stop(self, sig):
+        """Handle interrupt signals (runs as a regular event loop callback)"""
         logger.info(f"Received signal {sig}, shutting down...")
-        self.running = False
+        self._cancel()
+    
+    def _cancel(self):
+        """Wake pending waits and cancel the scheduled commit loop"""
+        self._stop_event.set()
+        if self._run_task is not None and not self._run_task.done():
+            self._run_task.cancel()
+    
+    def signal_handler(self, sig, frame):
+        """Handle interrupt signals delivered outside the event loop"""
+        asyncio.get_event_loop().call_soon_threadsafe(self._on_stop, sig)
     
     async def initialize(self) -> bool:
         """Initialize all components"""
@@ -52,7 +67,7 @@ class GitHubAIAgentApp:
         
         # Test LLM connections
         logger.info("Testing LLM connections...")
-        llm_status = self.llm_manager.test_connection()
+        llm_status = await self.llm_manager.test_connection()
         working_providers = [p for p, s in llm_status.items() if s]
         
         if not working_providers:
@@ -65,15 +80,23 @@ class GitHubAIAgentApp:
         logger.info(f"Working LLM providers: {', '.join(working_providers)}")
         
         # Initialize agents
+        from agents.github_agent import GitHubAgent
+        from agents.A1_content_agent import ContentAgent
+        
         self.github_agent = GitHubAgent(self.repo_url, self.llm_manager)
         self.A1_content_agent = ContentAgent(self.llm_manager)
         
-        # Initialize agents
-        if not self.github_agent.initialize():
+        # Initialize agents concurrently; the clone must not hold up the content agent
+        github_ok, content_ok = await asyncio.gather(
+            self.github_agent.initialize_async(),
+            asyncio.to_thread(self.A1_content_agent.initialize)
+        )
+        
+        if not github_ok:
             logger.error("Failed to initialize GitHub agent")
             return False
         
-        if not self.A1_content_agent.initialize():
+        if not content_ok:
             logger.error("Failed to initialize content agent")
             return False
         
@@ -110,6 +133,8 @@ class GitHubAIAgentApp:
     
     async def run(self):
         """Main run loop"""
+        self._install_signal_handlers()
+        
         # Initialize
         if not await self.initialize():
             logger.error("Initialization failed. Exiting.")
@@ -131,7 +156,11 @@ class GitHubAIAgentApp:
         logger.info("Press Ctrl+C to exit or wait 10 seconds to continue...")
         
         try:
-            await asyncio.sleep(10)
+            await asyncio.wait_for(self._stop_event.wait(), timeout=10)
+            logger.info("User cancelled scheduled commits")
+            return
+        except asyncio.TimeoutError:
+            pass
         except asyncio.CancelledError:
             logger.info("User cancelled scheduled commits")
             return
@@ -149,20 +178,49 @@ class GitHubAIAgentApp:
         start_time = datetime.now()
         self.scheduler.generate_new_schedule(start_time)
         
-        self.running = True
+        # The loop runs as its own task so shutdown can cancel it directly
+        self._run_task = asyncio.create_task(self._commit_loop())
+        try:
+            await self._run_task
+        except asyncio.CancelledError:
+            logger.info("Scheduled commits cancelled")
+        finally:
+            self._run_task = None
         
-        while self.running and not self.scheduler.should_stop():
+        # Log final statistics
+        progress = self.scheduler.get_schedule_progress()
+        logger.info("=" * 50)
+        logger.info("COMMIT SESSION COMPLETED!")
+        logger.info(f"Total commits attempted: {progress['completed']}")
+        logger.info(f"Successful commits: {progress['successful']}")
+        logger.info(f"Failed commits: {progress['completed'] - progress['successful']}")
+        logger.info("=" * 50)
+    
+    async def _commit_loop(self):
+        """Execute commits as they come due until the schedule or window ends"""
+        while not self.scheduler.should_stop():
             try:
                 # Wait for next commit time
-                commit_time = await self.scheduler.wait_for_next_commit()
+                commit_time = await self.scheduler.wait_for_next_commit(self._stop_event)
                 
                 if not commit_time:
                     logger.info("No more scheduled commits")
                     break
                 
                 # Execute commit
-                logger.info(f"Executing scheduled commit at {datetime.now().strftime('%H:%M:%S')}")
-                success, message = await self.github_agent.execute(self.A1_content_agent)
+                logger.info(f"Executing scheduled commit at {datetime.now():%H:%M:%S}")
+                # Shielded: git IO on the repo-io thread can't be interrupted, so a
+                # shutdown lets the cycle push and be recorded before stopping
+                cycle = asyncio.ensure_future(self.github_agent.execute(self.A1_content_agent))
+                try:
+                    success, message = await asyncio.shield(cycle)
+                except asyncio.CancelledError:
+                    try:
+                        success, message = await cycle
+                        self.scheduler.mark_commit_completed(success)
+                    except Exception as e:
+                        logger.error(f"Error in scheduled commit: {e}")
+                    raise
                 
                 # Mark as completed
                 self.scheduler.mark_commit_completed(success)
@@ -177,32 +235,20 @@ class GitHubAIAgentApp:
                 progress = self.scheduler.get_schedule_progress()
                 logger.info(f"Progress: {progress['completed']}/{progress['total_scheduled']} commits completed")
                 
-            except asyncio.CancelledError:
-                logger.info("Scheduled commits cancelled")
-                break
             except Exception as e:
                 logger.error(f"Error in scheduled commit: {e}")
                 # Continue with next commit
                 await asyncio.sleep(5)
-        
-        # Log final statistics
-        progress = self.scheduler.get_schedule_progress()
-        logger.info("=" * 50)
-        logger.info("COMMIT SESSION COMPLETED!")
-        logger.info(f"Total commits attempted: {progress['completed']}")
-        logger.info(f"Successful commits: {progress['successful']}")
-        logger.info(f"Failed commits: {progress['completed'] - progress['successful']}")
-        logger.info("=" * 50)
-        
-        self.running = False
     
     async def stop(self):
         """Stop the application"""
-        self.running = False
+        self._cancel()
         logger.info("Stopping application...")
 
 async def main():
     """Main entry point"""
+    start_log_listener()
+    
     # Configuration
     REPO_URL = "https://github.com/chintak07/github_ai_agents.git"
     
@@ -213,8 +259,13 @@ async def main():
         logger.error("GITHUB_TOKEN=your_token_here")
         logger.error("GITHUB_USERNAME=chintak07")
         logger.error("\nOr set them as environment variables.")
+        stop_log_listener()
         return
     
+    # Run tasks eagerly until their first suspension (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # Create and run app
     app = GitHubAIAgentApp(REPO_URL)
     
@@ -228,7 +279,9 @@ async def main():
         import traceback
         traceback.print_exc()
     finally:
+        await app.llm_manager.aclose()
         logger.info("Application shutdown complete")
+        stop_log_listener()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
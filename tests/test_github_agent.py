@@ -0,0 +1,41 @@
+import asyncio
+import unittest
+
+from agents.github_agent import GitHubAgent
+
+
+class GenerateCommitMessageCacheTest(unittest.TestCase):
+    """Commit message cache hit path"""
+    
+    def setUp(self):
+        self.agent = GitHubAgent("https://example.com/user/repo.git")
+        self.calls = []
+        
+        async def fake_llm(prompt, system_prompt=None, max_tokens=1000, stop=None):
+            self.calls.append(prompt)
+            return self.reply
+        
+        self.agent.generate_with_llm = fake_llm
+    
+    def test_reuses_message_for_equivalent_change(self):
+        self.reply = "docs: add machine learning article"
+        first = asyncio.run(self.agent.generate_commit_message("Added articles/ml_20261015_081044.md"))
+        second = asyncio.run(self.agent.generate_commit_message("Added articles/ml_20261015_143012.md"))
+        
+        self.assertEqual(first, "docs: add machine learning article")
+        self.assertTrue(second.startswith("docs: add machine learning article ("))
+        self.assertLessEqual(len(second), 72)
+        self.assertEqual(len(self.calls), 1)
+    
+    def test_does_not_reuse_message_naming_old_file(self):
+        self.reply = "docs: add ml_20261015_081044.md"
+        asyncio.run(self.agent.generate_commit_message("Added articles/ml_20261015_081044.md"))
+        self.reply = "docs: add ml_20261015_143012.md"
+        second = asyncio.run(self.agent.generate_commit_message("Added articles/ml_20261015_143012.md"))
+        
+        self.assertEqual(second, "docs: add ml_20261015_143012.md")
+        self.assertEqual(len(self.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
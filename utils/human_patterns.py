@@ -1,9 +1,6 @@
-import random
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
-from enum import Enum
-import logging
+from typing import List, Optional
 
 from utils.logger import setup_logger
 logger = setup_logger(__name__)
@@ -12,12 +9,14 @@ class CommitPatternGenerator:
     """Generator for randomized commit patterns"""
     
     def __init__(self, min_commits: int = 20, max_commits: int = 30, 
-                 window_hours: int = 8, randomize: bool = True):
+                 window_hours: int = 8, randomize: bool = True,
+                 seed: Optional[int] = None):
         self.min_commits = min_commits
         self.max_commits = max_commits
         self.window_hours = window_hours
         self.randomize = randomize
-        self.last_commit_time = None
+        # Dedicated generator; pass a seed for reproducible schedules
+        self._rng = np.random.default_rng(seed)
         
     def generate_commit_schedule(self, start_time: datetime) -> List[datetime]:
         """
@@ -28,70 +27,48 @@ class CommitPatternGenerator:
             # Evenly distribute commits
             num_commits = self.max_commits
             interval = self.window_hours * 3600 / num_commits
-            return [start_time + timedelta(seconds=i*interval) 
-                    for i in range(num_commits)]
+            offsets = np.arange(num_commits, dtype=np.float64) * interval
+            return [start_time + timedelta(seconds=float(s)) for s in offsets]
+        
+        rng = self._rng
+        window_seconds = self.window_hours * 3600
         
         # Random number of commits (20-30)
-        num_commits = random.randint(self.min_commits, self.max_commits)
+        num_commits = int(rng.integers(self.min_commits, self.max_commits, endpoint=True))
         logger.info(f"Generating {num_commits} commits over {self.window_hours} hours")
         
-        commit_times = []
+        # Draw all intervals up front; every draw yields at least one commit,
+        # so num_commits draws always cover the schedule.
+        # Base interval: 10-45 minutes (600-2700 seconds) with some randomness
+        intervals = rng.uniform(600, 2700, size=num_commits) * rng.uniform(0.7, 1.3, size=num_commits)
         
-        # Use exponential distribution for natural-looking intervals
-        # with some clustering to simulate "work sessions"
-        current_time = start_time
-        end_time = start_time + timedelta(hours=self.window_hours)
+        # Chance of clustering (multiple commits close together) to simulate "work sessions"
+        is_cluster = rng.random(num_commits) < 0.2  # 20% chance of clustering
+        cluster_sizes = np.where(is_cluster, rng.integers(2, 4, size=num_commits, endpoint=True), 1)
         
-        while len(commit_times) < num_commits and current_time < end_time:
-            # Base interval: 10-45 minutes (600-2700 seconds)
-            base_interval = random.uniform(600, 2700)
-            
-            # Add some randomness
-            random_factor = random.uniform(0.7, 1.3)
-            interval = base_interval * random_factor
-            
-            # Chance of clustering (multiple commits close together)
-            if random.random() < 0.2:  # 20% chance of clustering
-                cluster_size = random.randint(2, 4)
-                for _ in range(cluster_size):
-                    if len(commit_times) >= num_commits or current_time >= end_time:
-                        break
-                    commit_times.append(current_time)
-                    # Small gap between clustered commits (1-5 minutes)
-                    current_time += timedelta(seconds=random.uniform(60, 300))
-            else:
-                # Single commit
-                commit_times.append(current_time)
-                current_time += timedelta(seconds=interval)
+        # Gap after each commit: 1-5 minutes inside a cluster, the drawn interval otherwise
+        in_cluster = np.repeat(is_cluster, cluster_sizes)
+        gaps = np.where(
+            in_cluster,
+            rng.uniform(60, 300, size=in_cluster.size),
+            np.repeat(intervals, cluster_sizes)
+        )
         
-        # Ensure we have the right number of commits
-        if len(commit_times) > num_commits:
-            commit_times = commit_times[:num_commits]
-        elif len(commit_times) < num_commits:
-            # Fill remaining slots with random times
-            while len(commit_times) < num_commits:
-                random_time = start_time + timedelta(
-                    seconds=random.uniform(0, self.window_hours * 3600)
-                )
-                commit_times.append(random_time)
+        # Each commit happens before its gap elapses
+        offsets = np.concatenate(([0.0], np.cumsum(gaps)[:-1]))
+        offsets = offsets[offsets < window_seconds][:num_commits]
         
-        # Sort times
-        commit_times.sort()
+        # Fill remaining slots with random times
+        if offsets.size < num_commits:
+            offsets = np.concatenate((offsets, rng.uniform(0, window_seconds, size=num_commits - offsets.size)))
         
-        # Avoid patterns by adding small random jitter
-        jittered_times = []
-        for time in commit_times:
-            jitter = timedelta(seconds=random.uniform(-120, 120))
-            jittered_time = time + jitter
-            # Ensure time is within window
-            if start_time <= jittered_time <= end_time:
-                jittered_times.append(jittered_time)
-            else:
-                jittered_times.append(time)
+        # Avoid patterns by adding small random jitter, clamped to the window,
+        # then sort once
+        offsets += rng.uniform(-120, 120, size=offsets.size)
+        offsets = np.sort(np.clip(offsets, 0, window_seconds))
         
-        logger.info(f"Generated {len(jittered_times)} commit times")
-        return jittered_times
-    
-    def should_commit_now(self) -> bool:
-        """Check if a commit should be made right now (for immediate first commit)"""
-        return True
\ No newline at end of file
+        # Only materialize datetimes at the boundary
+        commit_times = [start_time + timedelta(seconds=float(s)) for s in offsets]
+        
+        logger.info(f"Generated {len(commit_times)} commit times")
+        return commit_times
\ No newline at end of file
@@ -1,12 +1,26 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from typing import Optional
 
-def setup_logger(name: str) -> logging.Logger:
-    """Setup logger with UTF-8 encoding for Windows compatibility"""
-    logger = logging.getLogger(name)
-    
-    # Remove existing handlers
-    logger.handlers.clear()
+from config.settings import LOG_LEVEL
+
+# Records are only enqueued on the calling (event loop) thread; a background
+# QueueListener owns the console and file handlers and does the actual IO
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Message only; the listener's handlers apply the full format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_listener: Optional[logging.handlers.QueueListener] = None
+_CONFIGURED = False
+
+def start_log_listener():
+    """Start the background thread writing queued records to console and file"""
+    global _listener
+    if _listener is not None:
+        return
     
     # Create formatter
     formatter = logging.Formatter(
@@ -16,14 +30,37 @@ def setup_logger(name: str) -> logging.Logger:
     # Console handler with UTF-8
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
     
     # File handler with UTF-8
     file_handler = logging.FileHandler('github_agent.log', encoding='utf-8')
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
-    logger.setLevel(logging.INFO)
-    logger.propagate = False
+    _listener = logging.handlers.QueueListener(
+        _log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+def stop_log_listener():
+    """Flush pending records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+def setup_logger(name: str) -> logging.Logger:
+    """Return a logger that propagates to the shared root queue handler (installed once)"""
+    global _CONFIGURED
+    if not _CONFIGURED:
+        # Single handler chain on the root logger; module loggers propagate to it
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        root.setLevel(getattr(logging, LOG_LEVEL))
+        # Drain the queue for every entry point, not just main(); flush on exit
+        start_log_listener()
+        atexit.register(stop_log_listener)
+        _CONFIGURED = True
     
-    return logger
\ No newline at end of file
+    return logging.getLogger(name)
\ No newline at end of file
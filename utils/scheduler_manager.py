@@ -1,8 +1,10 @@
 import asyncio
 import random
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import logging
+from typing import Dict, Optional
+
+import numpy as np
 
 from utils.human_patterns import CommitPatternGenerator
 from config.settings import MIN_COMMITS_PER_DAY, MAX_COMMITS_PER_DAY, COMMIT_WINDOW_HOURS
@@ -13,16 +15,22 @@ logger = setup_logger(__name__)
 class SchedulerManager:
     """Manages scheduling of commits"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.pattern_generator = CommitPatternGenerator(
             min_commits=MIN_COMMITS_PER_DAY,
             max_commits=MAX_COMMITS_PER_DAY,
             window_hours=COMMIT_WINDOW_HOURS,
-            randomize=True
+            randomize=True,
+            seed=seed
         )
-        self.schedule: List[datetime] = []
+        self._rng = random.Random(seed)
+        # Commit times as sorted int64 Unix epoch nanoseconds; datetimes are
+        # only materialized for logging and reporting
+        self._schedule_ns = np.empty(0, dtype=np.int64)
+        # Monotonic-clock deadlines (time.monotonic, the clock asyncio's loop.time uses)
+        self._deadlines = np.empty(0, dtype=np.float64)
+        self._window_deadline: Optional[float] = None
         self.next_commit_idx = 0
-        self.is_running = False
         self.start_time = None
         self.total_commits = 0
         self.successful_commits = 0
@@ -30,23 +38,35 @@ class SchedulerManager:
     def generate_new_schedule(self, start_from: Optional[datetime] = None):
         """Generate a new random schedule"""
         start_time = start_from or datetime.now()
-        self.schedule = self.pattern_generator.generate_commit_schedule(start_time)
+        schedule = self.pattern_generator.generate_commit_schedule(start_time)
+        self._schedule_ns = (np.array([t.timestamp() for t in schedule], dtype=np.float64) * 1e9).astype(np.int64)
         self.next_commit_idx = 0
         self.start_time = start_time
         
-        # Log schedule
-        logger.info("Generated commit schedule:")
-        for i, commit_time in enumerate(self.schedule[:10]):  # Show first 10
-            logger.info(f"  {i+1:2d}. {commit_time.strftime('%H:%M:%S')}")
-        if len(self.schedule) > 10:
-            logger.info(f"  ... and {len(self.schedule) - 10} more")
+        # Convert once to monotonic deadlines
+        now_ns = time.time_ns()
+        now_mono = time.monotonic()
+        self._deadlines = now_mono + (self._schedule_ns - now_ns) / 1e9
+        self._window_deadline = now_mono + (start_time.timestamp() - now_ns / 1e9) + COMMIT_WINDOW_HOURS * 3600
+        
+        # Log schedule as a single record
+        lines = ["Generated commit schedule:"]
+        lines += [f"  {i+1:2d}. {commit_time:%H:%M:%S}"
+                  for i, commit_time in enumerate(schedule[:10])]  # Show first 10
+        if len(schedule) > 10:
+            lines.append(f"  ... and {len(schedule) - 10} more")
+        logger.info("\n".join(lines))
         
-        return self.schedule
+        return schedule
+    
+    def _as_datetime(self, idx: int) -> datetime:
+        """Materialize the scheduled commit at idx as a local datetime"""
+        return datetime.fromtimestamp(int(self._schedule_ns[idx]) / 1e9)
     
     def get_next_commit_time(self) -> Optional[datetime]:
         """Get the next scheduled commit time"""
-        if self.next_commit_idx < len(self.schedule):
-            return self.schedule[self.next_commit_idx]
+        if self.next_commit_idx < self._schedule_ns.size:
+            return self._as_datetime(self.next_commit_idx)
         return None
     
     def mark_commit_completed(self, success: bool = True):
@@ -58,49 +78,57 @@ class SchedulerManager:
     
     def get_schedule_progress(self) -> Dict:
         """Get current schedule progress"""
-        now = datetime.now()
-        upcoming = [t for t in self.schedule if t > now]
+        # Schedule is sorted; binary search for the first future commit
+        total = self._schedule_ns.size
+        idx = int(np.searchsorted(self._schedule_ns, time.time_ns(), side="right"))
         
         return {
-            "total_scheduled": len(self.schedule),
+            "total_scheduled": total,
             "completed": self.next_commit_idx,
-            "remaining": len(self.schedule) - self.next_commit_idx,
-            "upcoming": len(upcoming),
+            "remaining": total - self.next_commit_idx,
+            "upcoming": total - idx,
             "successful": self.successful_commits,
-            "next_commit": upcoming[0] if upcoming else None,
+            "next_commit": self._as_datetime(idx) if idx < total else None,
             "window_end": self.start_time + timedelta(hours=COMMIT_WINDOW_HOURS) if self.start_time else None
         }
     
-    async def wait_for_next_commit(self) -> Optional[datetime]:
-        """Wait until the next commit time"""
-        if self.next_commit_idx >= len(self.schedule):
+    async def wait_for_next_commit(self, stop_event: Optional[asyncio.Event] = None) -> Optional[datetime]:
+        """Wait until the next commit time, or return None early once stop_event is set"""
+        if self.next_commit_idx >= self._schedule_ns.size:
+            return None
+        if stop_event is not None and stop_event.is_set():
             return None
         
-        next_time = self.schedule[self.next_commit_idx]
-        now = datetime.now()
+        next_time = self._as_datetime(self.next_commit_idx)
         
-        if next_time <= now:
+        # Calculate wait time
+        wait_seconds = float(self._deadlines[self.next_commit_idx]) - time.monotonic()
+        
+        if wait_seconds <= 0:
             # Commit is due now or overdue
             return next_time
         
-        # Calculate wait time
-        wait_seconds = (next_time - now).total_seconds()
+        # Add some random jitter to avoid exact timing patterns
+        jitter = self._rng.uniform(-30, 30)  # ±30 seconds
+        wait_seconds = max(1, wait_seconds + jitter)
         
-        if wait_seconds > 0:
-            # Add some random jitter to avoid exact timing patterns
-            jitter = random.uniform(-30, 30)  # ±30 seconds
-            wait_seconds = max(1, wait_seconds + jitter)
-            
-            logger.info(f"Waiting {wait_seconds:.0f} seconds until next commit at {next_time.strftime('%H:%M:%S')}")
+        logger.info(f"Waiting {wait_seconds:.0f} seconds until next commit at {next_time:%H:%M:%S}")
+        if stop_event is None:
             await asyncio.sleep(wait_seconds)
+        else:
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=wait_seconds)
+                # Stop requested while waiting
+                return None
+            except asyncio.TimeoutError:
+                pass
         
         return next_time
     
     def should_stop(self) -> bool:
         """Check if scheduler should stop"""
-        if not self.start_time:
+        if self._window_deadline is None:
             return False
         
         # Stop after window hours
-        window_end = self.start_time + timedelta(hours=COMMIT_WINDOW_HOURS)
-        return datetime.now() >= window_end or self.next_commit_idx >= len(self.schedule)
\ No newline at end of file
+        return time.monotonic() >= self._window_deadline or self.next_commit_idx >= self._schedule_ns.size
\ No newline at end of file